@@ -1065,5 +1065,9 @@ class PdfMdApp(tk.Tk):
 
 
 if __name__ == "__main__":
+    # Extraction may use worker processes; required for frozen Windows builds.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     app = PdfMdApp()
     app.mainloop()
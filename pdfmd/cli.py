@@ -61,6 +61,16 @@ def _make_colors(enable: bool) -> _Colors:
 # ---------------------------------------------------------------------------
 
 
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return n
+
+
 def _build_parser() -> argparse.ArgumentParser:
     description = (
         "Convert PDF files to clean, Obsidian-ready Markdown with table and "
@@ -83,6 +93,9 @@ Examples:
   # Force Tesseract OCR and export page images
   pdfmd book_scan.pdf --ocr tesseract --export-images
 
+  # OCR a large scan with at most two worker processes (limits memory use)
+  pdfmd big_scan.pdf --ocr tesseract --jobs 2
+
   # Preview only (first few pages) with stats
   pdfmd long_paper.pdf --preview-only --stats
 
@@ -147,6 +160,27 @@ Security notes:
         ),
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help=(
+            "Worker processes for text extraction and OCR, and worker threads for\n"
+            "transforms and rendering on free-threaded Python (default: one per\n"
+            "CPU). Lower this (e.g. --jobs 2) when OCR of large scans runs out of\n"
+            "memory."
+        ),
+    )
+
+    parser.add_argument(
+        "--tmp-dir",
+        default=None,
+        metavar="DIR",
+        help="Directory for OCR temporary files (default: system temp directory).",
+    )
+
     parser.add_argument(
         "--export-images",
         action="store_true",
@@ -221,6 +255,9 @@ def _make_options(args: argparse.Namespace) -> Options:
     # Extraction / OCR
     opts.ocr_mode = args.ocr
     opts.preview_only = bool(args.preview_only)
+    # The library runs in-process unless asked; the CLI uses every CPU.
+    opts.jobs = args.jobs or os.cpu_count() or 1
+    opts.tmp_dir = args.tmp_dir
 
     # Rendering / output
     opts.insert_page_breaks = bool(args.page_breaks)
@@ -579,4 +616,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
 
 if __name__ == "__main__":
+    # Extraction may use worker processes; required for frozen Windows builds.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -5,8 +5,9 @@ list of `PageText` objects for the given PDF. It supports three modes:
 
 - Native (PyMuPDF): fast, faithful when the PDF contains real text.
 - OCR via Tesseract (optional): render each page → run pytesseract.
-- OCR via OCRmyPDF (optional): pre-process the whole PDF with `ocrmypdf`, then
-  run the native extractor on the OCR'ed PDF. Useful for scanned PDFs while
+- OCR via OCRmyPDF (optional): pre-process the whole PDF with `ocrmypdf`
+  (in concurrent page ranges for long documents), then run the native
+  extractor on the OCR'ed PDF. Useful for scanned PDFs while
   preserving layout and selectable text.
 
 The chosen path is controlled by `Options.ocr_mode`:
@@ -14,18 +15,27 @@ The chosen path is controlled by `Options.ocr_mode`:
 When set to "auto", a quick probe examines the first few pages and switches to
 OCR if the doc appears scanned.
 
+Native extraction of larger documents is spread over a process pool, each
+worker opening its own document handle and extracting a contiguous block of
+pages; small documents stay on the single-process path.
+
 The module also contains helper functions for OCR probing, Tesseract/ocrmypdf
 availability checks, and a small wrapper around temporary files.
 """
 
 from __future__ import annotations
 
-import io
+import functools
+import math
 import os
+import queue
 import shutil
 import subprocess
 import tempfile
-from typing import Callable, List, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterator, List, Optional, cast
 
 try:
     import fitz  # type: ignore
@@ -47,7 +57,7 @@ except Exception:  # pragma: no cover - optional dependency
     _HAS_PIL = False
 
 from .models import PageText, Options
-from .utils import log
+from .utils import log, worker_count
 
 
 # ---------------------- Secure PDF open helpers -----------------------
@@ -102,8 +112,9 @@ def _prepare_ocr_input(pdf_path: str, pdf_password: Optional[str], tmpdir: str)
     2. Write a temporary, decrypted copy inside *tmpdir*.
     3. Return the path to that temporary copy for OCRmyPDF to process.
 
-    The temporary file lives only in the OS temp directory and is deleted
-    together with *tmpdir* once processing completes.
+    The temporary file lives only in *tmpdir* (created under `Options.tmp_dir`
+    or the system temp directory) and is deleted together with it once
+    processing completes.
     """
     # First try opening the document; this will also validate the password if needed.
     doc = _open_pdf_with_password(pdf_path, pdf_password)
@@ -152,22 +163,26 @@ def extract_pages(
         return _extract_native(pdf_path, options, progress_cb, pdf_password)
 
     if mode == "auto":
-        if _needs_ocr_probe(pdf_path, pdf_password):
-            log("[extract] Auto: scanned PDF detected.")
-            if _HAS_TESS and _HAS_PIL and _tesseract_available():
-                log("[extract] Using Tesseract OCR...")
-                return _extract_tesseract(pdf_path, options, progress_cb, pdf_password)
-            elif _which("ocrmypdf") and _tesseract_available():
-                log("[extract] Using OCRmyPDF...")
-                return _extract_ocrmypdf_then_native(pdf_path, options, progress_cb, pdf_password)
-            else:
-                log("[extract] WARNING: Scanned PDF detected but no OCR available!")
-                log("[extract] Install Tesseract from: https://github.com/UB-Mannheim/tesseract/wiki")
-                log("[extract] Then run: pip install pytesseract pillow")
-                log("[extract] Falling back to native extraction (may produce poor results).")
-                return _extract_native(pdf_path, options, progress_cb, pdf_password)
-        # Otherwise, native path
-        return _extract_native(pdf_path, options, progress_cb, pdf_password)
+        # One open serves both the scan probe and the extraction that follows.
+        doc = _open_pdf_with_password(pdf_path, pdf_password)
+        try:
+            if _needs_ocr_probe(doc):
+                log("[extract] Auto: scanned PDF detected.")
+                if _HAS_TESS and _HAS_PIL and _tesseract_available():
+                    log("[extract] Using Tesseract OCR...")
+                    return _extract_tesseract(pdf_path, options, progress_cb, pdf_password, doc=doc)
+                elif _which("ocrmypdf") and _tesseract_available():
+                    log("[extract] Using OCRmyPDF...")
+                    return _extract_ocrmypdf_then_native(pdf_path, options, progress_cb, pdf_password)
+                else:
+                    log("[extract] WARNING: Scanned PDF detected but no OCR available!")
+                    log("[extract] Install Tesseract from: https://github.com/UB-Mannheim/tesseract/wiki")
+                    log("[extract] Then run: pip install pytesseract pillow")
+                    log("[extract] Falling back to native extraction (may produce poor results).")
+            # Otherwise, native path
+            return _extract_native(pdf_path, options, progress_cb, pdf_password, doc=doc)
+        finally:
+            doc.close()
 
     if mode == "tesseract":
         if not (_HAS_TESS and _HAS_PIL):
@@ -201,15 +216,49 @@ def extract_pages(
 
 # ------------------------ Native PyMuPDF extraction ----------------------
 
+# PageText.from_pymupdf reads only block/line/span text, size, flags and font.
+# Leaving out TEXT_PRESERVE_IMAGES stops MuPDF from embedding every image's
+# binary data in the "dict" output; leaving out TEXT_PRESERVE_LIGATURES
+# expands ligature glyphs (e.g. "ﬁ" -> "fi"), which is what Markdown wants.
+_DICT_FLAGS = (
+    fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES & ~fitz.TEXT_PRESERVE_LIGATURES
+    if fitz is not None
+    else 0
+)
+
+# Pages handed to a worker process per task. Large enough to amortize process
+# start-up and result pickling, small enough to keep every core busy. PDFs of
+# a single chunk therefore stay on the in-process path.
+_NATIVE_CHUNK_PAGES = 10
+
+
+
+def _process_workers(tasks: int, jobs: Optional[int]) -> int:
+    """Worker processes for *tasks* independent tasks; 1 means in-process.
+
+    Process pools are opt-in: with *jobs* unset everything runs in-process.
+    On spawn platforms (Windows, macOS) each worker re-imports the caller's
+    ``__main__``, which breaks library scripts without a main guard. The CLI
+    passes the CPU count explicitly.
+    """
+    return worker_count(tasks, jobs) if jobs else 1
+
 
 def _extract_native(
     pdf_path: str,
     options: Options,
     progress_cb: DefProgress,
     pdf_password: Optional[str] = None,
+    doc=None,
 ) -> List[PageText]:
-    """Extract text using PyMuPDF's native text extraction."""
-    doc = _open_pdf_with_password(pdf_path, pdf_password)
+    """Extract text using PyMuPDF's native text extraction.
+
+    An already-open *doc* may be passed in (it is left open for the caller);
+    otherwise the PDF is opened here. Worker processes always open their own.
+    """
+    own_doc = doc is None
+    if own_doc:
+        doc = _open_pdf_with_password(pdf_path, pdf_password)
     try:
         total = doc.page_count
 
@@ -219,19 +268,86 @@ def _extract_native(
         limit = total if not options.preview_only else min(3, total)
         out: List[PageText] = []
 
-        for i in range(limit):
-            page = doc.load_page(i)
-            info = page.get_text("dict")
-            out.append(PageText.from_pymupdf(info))
+        workers = _process_workers(math.ceil(limit / _NATIVE_CHUNK_PAGES), options.jobs)
+        if workers > 1:
+            try:
+                for block in _extract_native_parallel(pdf_path, limit, workers, pdf_password):
+                    out.extend(block)
+                    if progress_cb:
+                        progress_cb(len(out), total)
+                return out
+            except BrokenProcessPool:
+                log("[extract] Worker process failed; retrying extraction in a single process.")
+
+        # Resume after whatever the pool already delivered.
+        for i in range(len(out), limit):
+            out.append(_native_page(doc.load_page(i)))
 
             if progress_cb:
                 progress_cb(i + 1, total)
 
         return out
+    finally:
+        if own_doc:
+            doc.close()
+
+
+def _extract_native_parallel(
+    pdf_path: str,
+    limit: int,
+    workers: int,
+    pdf_password: Optional[str] = None,
+) -> Iterator[List[PageText]]:
+    """Extract the first *limit* pages in blocks spread over a process pool.
+
+    Each worker opens its own document, so no PyMuPDF objects cross process
+    boundaries; only the resulting PageText lists are pickled back. Blocks
+    are yielded in submission order, which keeps pages in document order.
+
+    The password (if any) reaches the workers through the pool's in-memory
+    pipe only, never through command-line arguments or files.
+    """
+    chunk = _NATIVE_CHUNK_PAGES
+    ranges = [(start, min(start + chunk, limit)) for start in range(0, limit, chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_worker_extract_block, pdf_path, start, end, pdf_password)
+            for start, end in ranges
+        ]
+        try:
+            for fut in futures:
+                yield fut.result()
+        except BaseException:
+            # Do not start blocks nobody will collect (errors, GUI cancellation,
+            # or the consumer closing this generator early).
+            for fut in futures:
+                fut.cancel()
+            raise
+
+
+def _worker_extract_block(
+    pdf_path: str,
+    start: int,
+    end: int,
+    pdf_password: Optional[str] = None,
+) -> List[PageText]:
+    """Process-pool worker: extract pages [start, end) with a private handle."""
+    doc = _open_pdf_with_password(pdf_path, pdf_password)
+    try:
+        out: List[PageText] = []
+        for i in range(start, end):
+            out.append(_native_page(doc.load_page(i)))
+        return out
     finally:
         doc.close()
 
 
+def _native_page(page) -> PageText:
+    """Build a PageText from one PyMuPDF page using the trimmed dict flags."""
+    return PageText.from_pymupdf(page.get_text("dict", flags=_DICT_FLAGS))
+
+
 # ------------------------ Tesseract-based OCR path -----------------------
 
 
@@ -240,12 +356,21 @@ def _extract_tesseract(
     options: Options,
     progress_cb: DefProgress,
     pdf_password: Optional[str] = None,
+    doc=None,
 ) -> List[PageText]:
-    """Render each page to an image, feed into Tesseract, build PageText."""
+    """Render each page to an image, feed into Tesseract, build PageText.
+
+    With more than one worker available (see `Options.jobs`), pages are
+    rendered and recognised in a process pool, one page per task. Otherwise
+    rendering and recognition overlap within this process. An already-open
+    *doc* may be passed in, as for `_extract_native`.
+    """
     if not (_HAS_TESS and _HAS_PIL):  # pragma: no cover - guarded earlier
         raise RuntimeError("Tesseract/Pillow not available")
 
-    doc = _open_pdf_with_password(pdf_path, pdf_password)
+    own_doc = doc is None
+    if own_doc:
+        doc = _open_pdf_with_password(pdf_path, pdf_password)
     try:
         total = doc.page_count
 
@@ -253,36 +378,171 @@ def _extract_tesseract(
             raise ValueError("PDF has no pages")
 
         limit = total if not options.preview_only else min(3, total)
-        out: List[PageText] = []
 
         # Use 200 DPI for preview mode to save memory/time, 300 for full quality
         dpi = 200 if options.preview_only else 300
 
-        for i in range(limit):
-            page = doc.load_page(i)
+        workers = _process_workers(limit, options.jobs)
+        if workers > 1:
+            return _extract_tesseract_parallel(
+                pdf_path, limit, total, dpi, workers, progress_cb, pdf_password
+            )
+
+        return _ocr_pages_pipelined(doc, limit, total, dpi, progress_cb)
+    finally:
+        if own_doc:
+            doc.close()
 
-            # Render at higher DPI for better OCR
-            pix = page.get_pixmap(dpi=dpi)
-            if not hasattr(pix, "tobytes"):
-                raise RuntimeError("Unexpected: pixmap missing tobytes()")
 
-            png_bytes = pix.tobytes("png")
-            img = Image.open(io.BytesIO(png_bytes))
+# Marks the end of the rendered-page stream in _ocr_pages_pipelined.
+_RENDER_DONE = object()
 
-            # Let pytesseract detect layout at word/line level
-            data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
-            out.append(PageText.from_tesseract_data(data))
+
+def _ocr_pages_pipelined(
+    doc,
+    limit: int,
+    total: int,
+    dpi: int,
+    progress_cb: DefProgress,
+) -> List[PageText]:
+    """OCR the first *limit* pages in-process, rendering ahead on a thread.
+
+    Tesseract runs as a subprocess, so while this thread waits on it a
+    producer thread can already render the following pages. Only the
+    producer touches *doc*, and it has finished by the time this returns.
+    The queue holds at most two rendered pages, which bounds memory.
+    """
+    rendered: "queue.Queue" = queue.Queue(maxsize=2)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # Give up once the consumer has stopped listening.
+        while not stop.is_set():
+            try:
+                rendered.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for i in range(limit):
+                if not _put(_render_page_image(doc.load_page(i), dpi)):
+                    return
+            _put(_RENDER_DONE)
+        except BaseException as e:
+            _put(e)
+
+    producer = threading.Thread(target=_produce, name="pdfmd-ocr-render", daemon=True)
+    producer.start()
+
+    out: List[PageText] = []
+    try:
+        while True:
+            item = rendered.get()
+            if item is _RENDER_DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            out.append(_ocr_image(item))
 
             if progress_cb:
-                progress_cb(i + 1, total)
+                progress_cb(len(out), total)
+    finally:
+        # Also reached on errors and GUI cancellation: release the producer
+        # and wait for it, so the caller can close the document safely.
+        stop.set()
+        producer.join()
 
-        return out
+    return out
+
+
+def _extract_tesseract_parallel(
+    pdf_path: str,
+    limit: int,
+    total: int,
+    dpi: int,
+    workers: int,
+    progress_cb: DefProgress,
+    pdf_password: Optional[str] = None,
+) -> List[PageText]:
+    """OCR the first *limit* pages in a process pool, one page per task.
+
+    Progress is reported as pages complete; results are placed back by page
+    index so the output keeps document order.
+    """
+    out: List[Optional[PageText]] = [None] * limit
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker) as pool:
+        futures = {
+            pool.submit(_ocr_one_page, pdf_path, i, dpi, pdf_password): i
+            for i in range(limit)
+        }
+        try:
+            for done, fut in enumerate(as_completed(futures), start=1):
+                out[futures[fut]] = fut.result()
+                if progress_cb:
+                    progress_cb(done, total)
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+
+    # Every slot is filled above, or an exception has been raised.
+    return cast(List[PageText], out)
+
+
+def _init_ocr_worker() -> None:
+    """Pool initializer: one Tesseract thread per process.
+
+    Parallelism comes from the pool itself; letting every Tesseract process
+    also spin up OpenMP threads oversubscribes the CPU.
+    """
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _ocr_one_page(
+    pdf_path: str,
+    page_idx: int,
+    dpi: int,
+    pdf_password: Optional[str] = None,
+) -> PageText:
+    """Process-pool worker: open the PDF privately and OCR a single page."""
+    doc = _open_pdf_with_password(pdf_path, pdf_password)
+    try:
+        return _ocr_page(doc.load_page(page_idx), dpi)
     finally:
         doc.close()
 
 
+def _ocr_page(page, dpi: int) -> PageText:
+    """Render one PyMuPDF page at *dpi* and run Tesseract on it."""
+    return _ocr_image(_render_page_image(page, dpi))
+
+
+def _render_page_image(page, dpi: int):
+    """Render one PyMuPDF page at *dpi* to a grayscale PIL image."""
+    # Render at higher DPI for better OCR. The raw samples go straight into
+    # PIL: a PNG encode/decode round-trip would only burn CPU and memory.
+    # Grayscale is enough: Tesseract (via Leptonica) converts colour input to
+    # grayscale before binarizing anyway, and it is a third of the bytes.
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+def _ocr_image(img) -> PageText:
+    """Run Tesseract on a rendered page image."""
+    # Let pytesseract detect layout at word/line level
+    data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+    return PageText.from_tesseract_data(data)
+
+
 # ------------------------ OCRmyPDF + native path -------------------------
 
+# Pages per OCRmyPDF run when a document is split into page ranges.
+_OCRMYPDF_CHUNK_PAGES = 20
+
 
 def _extract_ocrmypdf_then_native(
     pdf_path: str,
@@ -294,130 +554,220 @@ def _extract_ocrmypdf_then_native(
 
     This allows combining OCR with PyMuPDF's excellent layout-preserving
     extraction on the OCR'ed output.
+
+    Documents longer than one chunk are split into page ranges that are
+    OCR'ed by separate OCRmyPDF runs (concurrently when several workers are
+    available) and merged back in order, which bounds the memory and temp
+    space each run needs.
     """
     ocrmypdf_bin = _which("ocrmypdf")
     if not ocrmypdf_bin:
         raise RuntimeError("ocrmypdf not found on PATH")
 
     # Create a temporary directory to hold the OCR'ed PDF
-    with tempfile.TemporaryDirectory(prefix="pdfmd_") as tmp:
+    with tempfile.TemporaryDirectory(prefix="pdfmd_", dir=options.tmp_dir) as tmp:
         out_pdf = os.path.join(tmp, "ocr.pdf")
 
         # Decide which file OCRmyPDF should read from (may create a decrypted temp copy).
         input_for_ocr = _prepare_ocr_input(pdf_path, pdf_password, tmp)
 
-        # Build command: --force-ocr ensures OCR even if text exists
-        # Removed --skip-text as it conflicts with --force-ocr
-        cmd = [ocrmypdf_bin, "--force-ocr", input_for_ocr, out_pdf]
-
+        src = fitz.open(input_for_ocr)
         try:
+            total = src.page_count
+            # Preview only ever looks at the first pages, so only OCR those.
+            limit = min(total, 3) if options.preview_only else total
+            ranges = [
+                (start, min(start + _OCRMYPDF_CHUNK_PAGES, limit))
+                for start in range(0, limit, _OCRMYPDF_CHUNK_PAGES)
+            ]
+            if len(ranges) <= 1 and limit == total:
+                chunk_inputs = [input_for_ocr]
+            else:
+                chunk_inputs = []
+                for n, (start, end) in enumerate(ranges):
+                    chunk_in = os.path.join(tmp, f"chunk_{n:04d}.pdf")
+                    sub = fitz.open()
+                    try:
+                        sub.insert_pdf(src, from_page=start, to_page=end - 1)
+                        sub.save(chunk_in)
+                    finally:
+                        sub.close()
+                    chunk_inputs.append(chunk_in)
+        finally:
+            src.close()
+
+        if len(chunk_inputs) == 1:
             log("[extract] Running OCRmyPDF (this may take a while)...")
-            # Set timeout to 10 minutes (600 seconds) to prevent hanging
-            # Capture output for progress logging
-            result = subprocess.run(
-                cmd,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=600,
+            _run_ocrmypdf(ocrmypdf_bin, chunk_inputs[0], out_pdf)
+        else:
+            chunk_outputs = [p[:-4] + "_ocr.pdf" for p in chunk_inputs]
+            workers = _process_workers(len(chunk_inputs), options.jobs)
+            # OCRmyPDF uses every CPU per run by default; split the CPUs
+            # between the concurrent runs instead of multiplying them.
+            ocr_jobs = max(1, (os.cpu_count() or 1) // workers)
+            log(
+                f"[extract] Running OCRmyPDF on {len(chunk_inputs)} page ranges "
+                f"with {workers} workers (this may take a while)..."
             )
-            # Log summary (avoid spamming full output)
-            if result.stdout:
-                log("[extract] ocrmypdf output (truncated):")
-                log("[extract] " + result.stdout.decode(errors="ignore").splitlines()[0])
-            if result.stderr:
-                first_err_line = result.stderr.decode(errors="ignore").splitlines()[0]
-                log("[extract] ocrmypdf stderr (first line):")
-                log("[extract] " + first_err_line)
-        except subprocess.TimeoutExpired:
-            log("[extract] ERROR: ocrmypdf timed out after 10 minutes.")
-            raise
-        except subprocess.CalledProcessError as e:
-            log(f"[extract] ERROR: ocrmypdf failed with return code {e.returncode}.")
-            if e.stdout:
-                log("[extract] stdout (truncated):")
-                log("[extract] " + e.stdout.decode(errors="ignore").splitlines()[0])
-            if e.stderr:
-                log("[extract] stderr (truncated):")
-                log("[extract] " + e.stderr.decode(errors="ignore").splitlines()[0])
-            raise
+            _run_ocrmypdf_chunks(
+                ocrmypdf_bin, chunk_inputs, chunk_outputs, workers, ocr_jobs
+            )
+
+            merged = fitz.open()
+            try:
+                for chunk_out in chunk_outputs:
+                    part = fitz.open(chunk_out)
+                    try:
+                        merged.insert_pdf(part)
+                    finally:
+                        part.close()
+                merged.save(out_pdf)
+            finally:
+                merged.close()
 
         # Now that we have OCR'ed PDF, run native extraction on it
         # The OCR output is never password protected.
         return _extract_native(out_pdf, options, progress_cb, None)
 
 
+def _run_ocrmypdf_chunks(
+    ocrmypdf_bin: str,
+    inputs: List[str],
+    outputs: List[str],
+    workers: int,
+    jobs: Optional[int] = None,
+) -> None:
+    """OCR each input PDF into the matching output path, *workers* at a time.
+
+    Each chunk is its own OCRmyPDF subprocess, so threads are enough to keep
+    them running side by side; *jobs* is passed to every run as its own
+    ``--jobs``. The first failing chunk cancels the ones that have not
+    started yet and its error is re-raised.
+    """
+    if workers <= 1:
+        for src, dst in zip(inputs, outputs):
+            _run_ocrmypdf(ocrmypdf_bin, src, dst, jobs)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [
+            ex.submit(_run_ocrmypdf, ocrmypdf_bin, src, dst, jobs)
+            for src, dst in zip(inputs, outputs)
+        ]
+        try:
+            for fut in as_completed(futures):
+                fut.result()
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+
+
+def _run_ocrmypdf(
+    ocrmypdf_bin: str, src: str, dst: str, jobs: Optional[int] = None
+) -> None:
+    """Run a single OCRmyPDF pass from *src* to *dst*, logging a summary.
+
+    *jobs* limits OCRmyPDF's own worker count; None keeps its default of
+    one per CPU.
+    """
+    # Build command: --force-ocr ensures OCR even if text exists
+    # Removed --skip-text as it conflicts with --force-ocr
+    cmd = [ocrmypdf_bin, "--force-ocr"]
+    if jobs:
+        cmd += ["--jobs", str(jobs)]
+    cmd += [src, dst]
+
+    try:
+        # Set timeout to 10 minutes (600 seconds) to prevent hanging
+        # Capture output for progress logging
+        result = subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=600,
+        )
+        # Log summary (avoid spamming full output)
+        if result.stdout:
+            log("[extract] ocrmypdf output (truncated):")
+            log("[extract] " + result.stdout.decode(errors="ignore").splitlines()[0])
+        if result.stderr:
+            first_err_line = result.stderr.decode(errors="ignore").splitlines()[0]
+            log("[extract] ocrmypdf stderr (first line):")
+            log("[extract] " + first_err_line)
+    except subprocess.TimeoutExpired:
+        log("[extract] ERROR: ocrmypdf timed out after 10 minutes.")
+        raise
+    except subprocess.CalledProcessError as e:
+        log(f"[extract] ERROR: ocrmypdf failed with return code {e.returncode}.")
+        if e.stdout:
+            log("[extract] stdout (truncated):")
+            log("[extract] " + e.stdout.decode(errors="ignore").splitlines()[0])
+        if e.stderr:
+            log("[extract] stderr (truncated):")
+            log("[extract] " + e.stderr.decode(errors="ignore").splitlines()[0])
+        raise
+
+
 # ----------------------- OCR probe and helpers ----------------------------
 
 
-def _needs_ocr_probe(
-    pdf_path: str,
-    pdf_password: Optional[str] = None,
-    pages_to_check: int = 3,
-) -> bool:
-    """Heuristic: determine if PDF is likely scanned and needs OCR.
+def _needs_ocr_probe(doc, pages_to_check: int = 3) -> bool:
+    """Heuristic: determine if an open PDF is likely scanned and needs OCR.
 
     We consider a PDF "scanned" if:
       1. Very little extractable text (< ~100 chars) on first pages
       2. Presence of large images covering most of the page area
       3. Low text density relative to page size
+
+    The caller owns *doc*; it is not closed here so extraction can reuse it.
     """
-    try:
-        doc = _open_pdf_with_password(pdf_path, pdf_password)
-    except Exception:
+    if doc.page_count == 0:
         return False
 
-    try:
-        if doc.page_count == 0:
-            return False
-
-        total = min(pages_to_check, doc.page_count)
-        text_chars = 0
-        scanned_indicators = 0
-
-        for i in range(total):
-            page = doc.load_page(i)
-            text = page.get_text("text").strip()
-            text_chars += len(text)
-
-            # Get page dimensions
-            rect = page.rect
-            page_area = rect.width * rect.height
-
-            # Check for images
-            images = page.get_images(full=True)
-            if images:
-                for img_info in images:
-                    try:
-                        xref = img_info[0]
-                        pix = fitz.Pixmap(doc, xref)
-                        img_area = pix.width * pix.height
-                        pix = None  # free resources
-                        # If image covers a large portion of the page, count it
-                        if img_area > 0.3 * page_area:
-                            scanned_indicators += 1
-                    except Exception:
-                        continue
-
-        # Very low text and presence of large images suggests scanned
-        if text_chars < 100 and scanned_indicators > 0:
-            return True
-
-        # Also treat very low text density as scanned
-        avg_text_per_page = text_chars / max(total, 1)
-        if avg_text_per_page < 50 and scanned_indicators > 0:
-            return True
+    total = min(pages_to_check, doc.page_count)
+    text_chars = 0
+    scanned_indicators = 0
 
-        return False
-    finally:
-        doc.close()
+    for i in range(total):
+        page = doc.load_page(i)
+        text = page.get_text("text").strip()
+        text_chars += len(text)
+
+        # Get page dimensions
+        rect = page.rect
+        page_area = rect.width * rect.height
+
+        # Check for images. get_images(full=True) already reports each
+        # image's pixel size as (xref, smask, width, height, ...), so the
+        # (possibly huge) image streams never need to be decoded here.
+        for img_info in page.get_images(full=True):
+            img_area = img_info[2] * img_info[3]
+            # If image covers a large portion of the page, count it
+            if img_area > 0.3 * page_area:
+                scanned_indicators += 1
+
+    # Very low text and presence of large images suggests scanned
+    if text_chars < 100 and scanned_indicators > 0:
+        return True
+
+    # Also treat very low text density as scanned
+    avg_text_per_page = text_chars / max(total, 1)
+    if avg_text_per_page < 50 and scanned_indicators > 0:
+        return True
+
+    return False
 
 
+@functools.lru_cache(maxsize=1)
 def _tesseract_available() -> bool:
     """Check if Tesseract is available on PATH.
 
     We prefer using pytesseract for detection because it is already imported
     when OCR is needed, but we also verify the underlying binary is callable.
+    The answer is cached for the life of the process, so batch runs spawn
+    `tesseract --version` only once.
     """
     if pytesseract is None:
         return False
@@ -433,35 +783,14 @@ def _tesseract_available() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=32)
 def _which(cmd: str) -> Optional[str]:
-    """Portable `which` implementation.
+    """Return the full path of *cmd* on PATH, or None.
 
-    Uses shutil.which when available, falls back to a simple PATH scan.
+    Thin cached wrapper over shutil.which, which already honours PATHEXT on
+    Windows. Results are cached per command for the life of the process.
     """
-    path = shutil.which(cmd)
-    if path:
-        return path
-
-    # Fallback scan
-    exts = [""]  # On Windows PATHEXT is used by shutil.which; we emulate minimal behaviour.
-    if os.name == "nt":
-        pathext = os.environ.get("PATHEXT", "")
-        exts.extend(ext.strip() for ext in pathext.split(os.pathsep) if ext.strip())
-
-    for p in os.environ.get("PATH", "").split(os.pathsep):
-        candidate = os.path.join(p, cmd)
-        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
-            return candidate
-
-        # On Windows, try with each extension
-        if os.name == "nt":
-            base = candidate
-            for e in exts:
-                cand2 = base + e
-                if os.path.isfile(cand2) and os.access(cand2, os.X_OK):
-                    return cand2
-
-    return None
+    return shutil.which(cmd)
 
 
 __all__ = [
@@ -161,6 +161,11 @@ class Options:
     # Extraction / OCR
     ocr_mode: Literal["off", "auto", "tesseract", "ocrmypdf"] = "off"
     preview_only: bool = False
+    # Worker processes for extraction/OCR; None = in-process (the CLI passes the CPU count).
+    # On free-threaded builds it also sizes the transform/render thread pools
+    # (None = one thread per CPU there).
+    jobs: Optional[int] = None
+    tmp_dir: Optional[str] = None  # scratch directory for OCR temp files; None = system default
 
     # Transform heuristics
     caps_to_headings: bool = True
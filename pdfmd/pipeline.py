@@ -118,8 +118,9 @@ def _export_images(
         limit = page_count if not options.preview_only else min(3, page_count)
 
         for pno in range(limit):
-            page = doc.load_page(pno)
-            images = page.get_images(full=True)
+            # Listing a page's images only needs its resources, not a parsed
+            # page, so ask the document instead of loading each page.
+            images = doc.get_page_images(pno, full=True)
             rels: List[str] = []
             
             for idx, img in enumerate(images, start=1):
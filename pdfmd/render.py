@@ -4,7 +4,7 @@ This module converts transformed `PageText` structures into Markdown.
 It assumes header/footer removal and drop-cap stripping have already been run
 (see `transform.py`).
 
-Main entry: `render_document(pages, options, body_sizes=None, progress_cb=None)`
+Main entry: `render_document(pages, options, body_sizes=None, progress_cb=None, out_fp=None)`
 
 Key behaviours:
 - Applies heading promotion via font size and optional CAPS heuristics.
@@ -16,15 +16,31 @@ Key behaviours:
 
 from __future__ import annotations
 
+import io
 import re
-from statistics import median
-from typing import Callable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Sized, TextIO
 
 from .models import Block, Line, PageText, Options
-from .utils import normalize_punctuation, linkify_urls, escape_markdown
+from .utils import normalize_punctuation, linkify_urls, escape_markdown, median, worker_count
 from .transform import is_all_caps_line, is_mostly_caps
 
 
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+# These run per line (or over the whole document), so compile them once
+# rather than going through the `re` module cache on every call.
+_HYPHEN_WRAP_PATTERN = re.compile(r"-\n(\s*)")
+_BULLET_PREFIX_PATTERN = re.compile(r"^[•○◦·\-–—]\s+")
+_NUMBERED_PREFIX_PATTERN = re.compile(r"^(\d+)[\.\)]\s+")
+_LETTERED_PREFIX_PATTERN = re.compile(r"^[A-Za-z][\.\)]\s+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TRAILING_FOOTER_PATTERN = re.compile(r"\s*-+\s*-+\s*\d*\s*$", re.MULTILINE)
+_SPACE_BEFORE_PUNCT_PATTERN = re.compile(r"\s+([,.;:?!])")
+
+
 # ---------------------------------------------------------------------------
 # Inline helpers
 # ---------------------------------------------------------------------------
@@ -64,43 +80,7 @@ def _fix_hyphenation(text: str) -> str:
 
     We only remove hyphen + newline when it is clearly a wrap.
     """
-    return re.sub(r"-\n(\s*)", r"\1", text)
-
-
-def _unwrap_hard_breaks(lines: List[str]) -> str:
-    """Merge wrapped lines into paragraphs. Blank lines remain paragraph breaks.
-
-    Rules:
-    - Consecutive non-blank lines are joined with spaces.
-    - Blank lines are preserved as paragraph separators.
-    - Lines ending with two spaces `"  "` are treated as explicit hard breaks
-      (Markdown convention) and terminate the paragraph.
-    """
-    out: List[str] = []
-    buf: List[str] = []
-
-    def flush() -> None:
-        if buf:
-            out.append(" ".join(buf).strip())
-            buf.clear()
-
-    for raw in lines:
-        line = raw.rstrip("\n")
-        if not line.strip():
-            flush()
-            out.append("")
-            continue
-
-        # Explicit hard break: keep line as-is and terminate paragraph buffer.
-        if line.endswith("  "):
-            buf.append(line)
-            flush()
-            continue
-
-        buf.append(line)
-
-    flush()
-    return "\n".join(out)
+    return _HYPHEN_WRAP_PATTERN.sub(r"\1", text)
 
 
 def _defragment_orphans(md: str, max_len: int = 45) -> str:
@@ -166,22 +146,29 @@ def _safe_join_texts(parts: List[str]) -> str:
 
 
 # Reuse footer noise heuristic from transform-like logic here for line-level cleanup.
-_FOOTER_DASH_PATTERN = re.compile(r"^[-–—]\s*[-–—]?\s*\d*\s*$")
-_FOOTER_PAGENUM_PATTERN = re.compile(r"^\d+\s*$")
-_FOOTER_PAGE_LABEL_PATTERN = re.compile(r"^Page\s+\d+\s*$", re.IGNORECASE)
+# One alternation (dash rule / bare page number / "Page N"), used with fullmatch.
+_FOOTER_NOISE_PATTERN = re.compile(
+    r"(?:[-–—]\s*[-–—]?\s*\d*|\d+|Page\s+\d+)\s*", re.IGNORECASE
+)
+
+# Deletes every character the dash / page-number patterns are built from.
+_FOOTER_NOISE_CHARS = str.maketrans("", "", "-–—0123456789")
 
 
 def _is_footer_noise(text: str) -> bool:
     s = text.strip()
     if not s:
         return False
-    if _FOOTER_DASH_PATTERN.match(s):
-        return True
-    if _FOOTER_PAGENUM_PATTERN.match(s):
-        return True
-    if _FOOTER_PAGE_LABEL_PATTERN.match(s):
-        return True
-    return False
+
+    # Cheap character-class screen before any regex runs. Ordinary text lines
+    # leave letters behind and are rejected here unless they start with "Page".
+    rest = s.translate(_FOOTER_NOISE_CHARS)
+    if rest and not rest.isspace() and rest.isascii() and s[:4].lower() != "page":
+        return False
+
+    # Dash/number-only lines, "Page N" candidates and non-ASCII leftovers
+    # (Unicode digits or spaces) take the full check.
+    return _FOOTER_NOISE_PATTERN.fullmatch(s) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -189,29 +176,78 @@ def _is_footer_noise(text: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+# First characters _BULLET_PREFIX_PATTERN can match.
+_BULLET_PREFIX_CHARS = frozenset("•○◦·-–—")
+
+
 def _normalize_list_line(ln: str) -> str:
     """Normalize various bullet/numbered prefixes into Markdown list syntax."""
     s = ln.lstrip()
+    # The three prefixes start with disjoint character classes, so the first
+    # characters pick the one pattern worth trying; most lines try none.
+    first = s[:1]
+
     # Bullet-like prefixes
-    if re.match(r"^[•○◦·\-–—]\s+", s):
-        s = re.sub(r"^[•○◦·\-–—]\s+", "- ", s)
-        return s
+    if first in _BULLET_PREFIX_CHARS:
+        m = _BULLET_PREFIX_PATTERN.match(s)
+        if m:
+            return "- " + s[m.end():]
 
     # Numbered: "1. text" or "1) text"
-    m_num = re.match(r"^(\d+)[\.\)]\s+", s)
-    if m_num:
-        num = m_num.group(1)
-        s = re.sub(r"^\d+[\.\)]\s+", f"{num}. ", s)
-        return s
+    elif first.isdecimal():
+        m = _NUMBERED_PREFIX_PATTERN.match(s)
+        if m:
+            return f"{m.group(1)}. " + s[m.end():]
 
     # Lettered outlines: "A. text" or "a) text" → bullet
-    if re.match(r"^[A-Za-z][\.\)]\s+", s):
-        s = re.sub(r"^[A-Za-z][\.\)]\s+", "- ", s)
-        return s
+    elif s[1:2] in (".", ")"):
+        m = _LETTERED_PREFIX_PATTERN.match(s)
+        if m:
+            return "- " + s[m.end():]
 
     return ln.strip()
 
 
+def _finalize_block_lines(lines: Iterable[str]) -> List[str]:
+    """Filter, normalise and unwrap a block's lines in a single pass.
+
+    Per line:
+    - Footer noise (page numbers, dash rules) is dropped.
+    - Bullet/numbered prefixes are normalised via `_normalize_list_line`.
+    - Consecutive non-blank lines are joined with spaces into paragraphs.
+    - Blank lines are kept as paragraph separators.
+    - Lines ending with two spaces `"  "` are treated as explicit hard breaks
+      (Markdown convention) and terminate the paragraph.
+
+    Returns the output lines (paragraphs and blank separators).
+    """
+    out: List[str] = []
+    buf: List[str] = []
+
+    for ln in lines:
+        if not ln.strip():
+            if buf:
+                out.append(" ".join(buf).strip())
+                buf.clear()
+            out.append("")
+            continue
+
+        if _is_footer_noise(ln):
+            continue
+
+        norm = _normalize_list_line(ln)
+        buf.append(norm)
+
+        # Explicit hard break: terminate the paragraph buffer.
+        if norm.endswith("  "):
+            out.append(" ".join(buf).strip())
+            buf.clear()
+
+    if buf:
+        out.append(" ".join(buf).strip())
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Table rendering
 # ---------------------------------------------------------------------------
@@ -357,7 +393,8 @@ def _block_to_lines(
     block: Block,
     body_size: float,
     caps_to_headings: bool,
-    heading_size_ratio: float,
+    h2_threshold: float,
+    h1_threshold: float,
 ) -> List[str]:
     """Convert a Block into a list of Markdown lines.
 
@@ -366,8 +403,11 @@ def _block_to_lines(
       - rendered_lines: text with inline styling (bold/italic), for body output
 
     Heading detection uses:
-      - average span font size vs body_size
+      - average span font size vs the page's h2/h1 size thresholds
+        (precomputed from the body size by the caller)
       - optional ALL-CAPS / MOSTLY-CAPS heuristic across the block
+
+    body_size stands in for the block's size when no span carries one.
     """
     # Tables: if this block was annotated as a table in transform.py,
     # render it via the table grid and skip paragraph / heading heuristics.
@@ -380,9 +420,6 @@ def _block_to_lines(
 
     for line in block.lines:
         spans = line.spans
-        texts_fmt: List[str] = []
-        texts_raw: List[str] = []
-        sizes: List[float] = []
 
         # --- Math-aware path: equations module sets dynamic attributes ---
         if getattr(line, "is_math", False):
@@ -397,7 +434,8 @@ def _block_to_lines(
             if kind == "display":
                 joined_fmt = f"$$\n{tex}\n$$"
                 joined_raw = tex
-                # Do not contribute to heading sizing; leave `sizes` empty.
+                # Do not contribute to heading sizing.
+                sizes: List[float] = []
 
             # Inline math: `tex` is the whole line with math segments already
             # normalized; we keep it as-is and again skip escape_markdown so
@@ -406,22 +444,16 @@ def _block_to_lines(
                 joined_fmt = tex
                 joined_raw = tex
                 # Use span sizes for body-size estimation if available.
-                for sp in spans:
-                    if getattr(sp, "size", 0.0):
-                        sizes.append(float(sp.size))
+                sizes = [float(sp.size) for sp in spans if sp.size]
 
         else:
             # Normal text line: escape Markdown and apply inline bold/italic.
-            for sp in spans:
-                raw_text = sp.text or ""
-                texts_raw.append(raw_text)
-
-                esc = escape_markdown(raw_text)
-                esc = _wrap_inline(esc, sp.bold, sp.italic)
-                texts_fmt.append(esc)
-
-                if getattr(sp, "size", 0.0):
-                    sizes.append(float(sp.size))
+            texts_raw = [sp.text or "" for sp in spans]
+            texts_fmt = [
+                _wrap_inline(escape_markdown(raw_text), sp.bold, sp.italic)
+                for raw_text, sp in zip(texts_raw, spans)
+            ]
+            sizes = [float(sp.size) for sp in spans if sp.size]
 
             joined_fmt = _safe_join_texts(texts_fmt)
             joined_raw = _safe_join_texts(texts_raw)
@@ -440,19 +472,19 @@ def _block_to_lines(
     # Use RAW text (no ** or *) for heading heuristics
     block_text_flat = " ".join(raw_lines).strip()
 
-    heading_by_size = avg_line_size >= body_size * heading_size_ratio
+    heading_by_size = avg_line_size >= h2_threshold
     heading_by_caps = caps_to_headings and (
         is_all_caps_line(block_text_flat) or is_mostly_caps(block_text_flat)
     )
 
     if heading_by_size or heading_by_caps:
         # H1 if much larger than body or if CAPS; otherwise H2
-        level = 1 if (avg_line_size >= body_size * 1.6) or heading_by_caps else 2
+        level = 1 if (avg_line_size >= h1_threshold) or heading_by_caps else 2
 
         # Heading text: use ONLY the first RAW line, not the formatted one
         heading_raw = raw_lines[0]
         heading_text = escape_markdown(heading_raw)
-        heading_text = re.sub(r"\s+", " ", heading_text).strip(" -:–—")
+        heading_text = _WHITESPACE_PATTERN.sub(" ", heading_text).strip(" -:–—")
         heading_text = normalize_punctuation(heading_text)
         heading_line = f"{'#' * level} {heading_text}"
 
@@ -463,19 +495,7 @@ def _block_to_lines(
         # Otherwise, render remaining lines as normal paragraph/list text
         tail_text = _fix_hyphenation("\n".join(rendered_lines[1:]))
 
-        lines: List[str] = []
-        for ln in tail_text.splitlines():
-            if not ln.strip():
-                lines.append("")
-                continue
-
-            if _is_footer_noise(ln):
-                continue
-
-            norm = _normalize_list_line(ln)
-            lines.append(norm)
-
-        para = _unwrap_hard_breaks(lines)
+        para = "\n".join(_finalize_block_lines(tail_text.splitlines()))
         para = normalize_punctuation(para)
         para = linkify_urls(para)
 
@@ -489,22 +509,75 @@ def _block_to_lines(
 
     para_text = _fix_hyphenation("\n".join(rendered_lines))
 
+    para = "\n".join(_finalize_block_lines(para_text.splitlines()))
+    para = normalize_punctuation(para)
+    para = linkify_urls(para)
+    return [para, ""]
+
+
+def _render_page(page: PageText, body: float, options: Options) -> List[str]:
+    """Render one page's blocks to Markdown lines (without a page rule).
+
+    Only reads its arguments, so pages can be rendered independently.
+    """
+    # Heading size thresholds only depend on the page's body size.
+    h2_threshold = body * options.heading_size_ratio
+    h1_threshold = body * 1.6
+
     lines: List[str] = []
-    for ln in para_text.splitlines():
-        if not ln.strip():
-            lines.append("")
+    for blk in page.blocks:
+        if blk.is_empty():
             continue
+        lines.extend(
+            _block_to_lines(
+                blk,
+                body_size=body,
+                caps_to_headings=options.caps_to_headings,
+                h2_threshold=h2_threshold,
+                h1_threshold=h1_threshold,
+            )
+        )
+    return lines
 
-        if _is_footer_noise(ln):
-            continue
 
-        norm = _normalize_list_line(ln)
-        lines.append(norm)
+# Minimum document length before pages are rendered on worker threads.
+# Rendering is pure-Python string work plus `re` calls, which hold the GIL, so
+# threads are only used on free-threaded builds (see `worker_count`).
+_PARALLEL_RENDER_MIN_PAGES = 16
+
+
+# ---------------------------------------------------------------------------
+# Output buffer
+# ---------------------------------------------------------------------------
 
-    para = _unwrap_hard_breaks(lines)
-    para = normalize_punctuation(para)
-    para = linkify_urls(para)
-    return [para, ""]
+
+class _MarkdownWriter:
+    """Accumulate Markdown lines in a StringIO, collapsing blank runs on the fly.
+
+    Equivalent to joining all lines with newlines, squeezing three or more
+    consecutive newlines down to two and stripping the result, without ever
+    holding the line list and the joined string side by side.
+    """
+
+    def __init__(self) -> None:
+        self._buf = io.StringIO()
+        self._started = False  # at least one non-empty line written
+        self._blank = False  # an empty line is pending before the next one
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        for chunk in lines:
+            for line in chunk.split("\n") if "\n" in chunk else (chunk,):
+                if not line:
+                    self._blank = self._started
+                    continue
+                if self._started:
+                    self._buf.write("\n\n" if self._blank else "\n")
+                self._buf.write(line)
+                self._started = True
+                self._blank = False
+
+    def getvalue(self) -> str:
+        return self._buf.getvalue().strip() + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -515,56 +588,81 @@ DefProgress = Optional[Callable[[int, int], None]]
 
 
 def render_document(
-    pages: List[PageText],
+    pages: Iterable[PageText],
     options: Options,
     body_sizes: Optional[List[float]] = None,
     progress_cb: DefProgress = None,
+    out_fp: Optional[TextIO] = None,
 ) -> str:
     """Render transformed pages to a Markdown string.
 
     Args:
-        pages: transformed PageText pages
+        pages: transformed PageText pages; any iterable (e.g. a generator)
+               works
         options: rendering options (see models.Options)
         body_sizes: optional per-page body-size baselines.
                     If not provided, the renderer falls back to 11.0.
-        progress_cb: optional progress callback (done, total)
+        progress_cb: optional progress callback (done, total); only called
+                     when the number of pages is known up front
+        out_fp: optional text stream the finished Markdown is also written
+                to. The whole document is still built in memory first.
     """
-    md_lines: List[str] = []
-    total = len(pages)
+    out = _MarkdownWriter()
+    total = len(pages) if isinstance(pages, Sized) else 0
 
-    for i, page in enumerate(pages):
-        body = body_sizes[i] if body_sizes and i < len(body_sizes) else 11.0
+    def _body(i: int) -> float:
+        return body_sizes[i] if body_sizes and i < len(body_sizes) else 11.0
 
-        for blk in page.blocks:
-            if blk.is_empty():
-                continue
-            md_lines.extend(
-                _block_to_lines(
-                    blk,
-                    body_size=body,
-                    caps_to_headings=options.caps_to_headings,
-                    heading_size_ratio=options.heading_size_ratio,
-                )
+    workers = (
+        worker_count(total, options.jobs, threads=True)
+        if total >= _PARALLEL_RENDER_MIN_PAGES
+        else 1
+    )
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    futures = []
+    try:
+        if executor is not None:
+            futures = [
+                executor.submit(_render_page, page, _body(i), options)
+                for i, page in enumerate(pages)
+            ]
+            rendered = (fut.result() for fut in futures)
+        else:
+            rendered = (
+                _render_page(page, _body(i), options) for i, page in enumerate(pages)
             )
 
-        if options.insert_page_breaks and i < total - 1:
-            md_lines.extend(["---", ""])  # page rule
+        # Pages are written in order whichever way they were rendered. The
+        # page rule goes before every page but the first, so the page count
+        # need not be known in advance.
+        for i, lines in enumerate(rendered):
+            if options.insert_page_breaks and i > 0:
+                out.write_lines(("---", ""))  # page rule
 
-        if progress_cb:
-            progress_cb(i + 1, total)
+            out.write_lines(lines)
 
-    md = "\n".join(md_lines)
-    # Collapse excessive blank lines
-    md = re.sub(r"\n{3,}", "\n\n", md).strip() + "\n"
+            if progress_cb and total:
+                progress_cb(i + 1, total)
+    finally:
+        if executor is not None:
+            for fut in futures:
+                fut.cancel()
+            executor.shutdown()
+
+    # Blank-line runs were already collapsed while writing.
+    md = out.getvalue()
 
     if options.defragment_short:
         md = _defragment_orphans(md, max_len=options.orphan_max_len)
 
     # Strip common footer artefacts like trailing "- - 1" or "- -" at end of lines
-    md = re.sub(r"\s*-+\s*-+\s*\d*\s*$", "", md, flags=re.MULTILINE)
+    md = _TRAILING_FOOTER_PATTERN.sub("", md)
 
     # Tighten spaces before punctuation
-    md = re.sub(r"\s+([,.;:?!])", r"\1", md)
+    md = _SPACE_BEFORE_PUNCT_PATTERN.sub(r"\1", md)
+
+    if out_fp is not None:
+        out_fp.write(md)
 
     return md
 
@@ -14,18 +14,97 @@ Included heuristics:
 - Compute body-size baselines used for heading promotion (by size).
 - Provide ALL-CAPS helpers used by the renderer for heading promotion.
 
-Transform functions return new `PageText` instances (immutability by copy), so
-upstream stages can compare before and after if needed.
+The cleaning transforms never modify their input: a page or block that needs a
+change is copied, while one that needs none is passed through as the same
+object, so upstream stages can compare before and after (`is`) if needed.
 """
 
 from collections import Counter
-from dataclasses import replace
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from enum import IntFlag
+from functools import partial
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import re
+import sys
 
 from .models import PageText, Block, Line, Span, Options
 from .tables import detect_tables_on_page
 from .equations import annotate_math_on_page
+from .utils import median, worker_count
+
+
+# ------------------------ Fast dataclass copies ------------------------
+
+
+def _field_replacer(cls, name: str):
+    """Build a specialised `dataclasses.replace(obj, <name>=value)` for *cls*.
+
+    The field list is resolved once here instead of on every call, and the
+    copy is assembled in the instance dict without going through __init__
+    (the models define no __post_init__). Like replace(), only dataclass
+    fields are copied; ad-hoc attributes such as ``is_table`` are not.
+    """
+    others = tuple(f.name for f in fields(cls) if f.init and f.name != name)
+    new = cls.__new__
+
+    if not others:
+        def _replace_one(obj, value):
+            inst = new(cls)
+            inst.__dict__[name] = value
+            return inst
+
+        return _replace_one
+
+    def _replace(obj, value):
+        inst = new(cls)
+        src = obj.__dict__
+        d = inst.__dict__
+        for other in others:
+            d[other] = src[other]
+        d[name] = value
+        return inst
+
+    return _replace
+
+
+_with_blocks = _field_replacer(PageText, "blocks")
+_with_lines = _field_replacer(Block, "lines")
+_with_spans = _field_replacer(Line, "spans")
+_with_text = _field_replacer(Span, "text")
+
+
+# --------------------------- Per-page workers ---------------------------
+
+
+# Minimum document length before per-page transforms run on worker threads.
+# The transforms are pure-Python object work, so threads are only used on
+# free-threaded builds (see `worker_count`). Worker processes do not pay off:
+# pickling a page to a worker and back costs more than transforming it.
+_PARALLEL_TRANSFORM_MIN_PAGES = 32
+
+
+def _parallel_map(
+    fn: Callable[[PageText], PageText],
+    pages: List[PageText],
+    jobs: Optional[int] = 1,
+) -> List[PageText]:
+    """Return ``[fn(p) for p in pages]``, spread over threads where that helps.
+
+    *jobs* follows `Options.jobs` (None = one worker per CPU). *fn* must
+    only read its page, which holds for all the per-page transforms here.
+    """
+    workers = (
+        worker_count(len(pages), jobs, threads=True)
+        if len(pages) >= _PARALLEL_TRANSFORM_MIN_PAGES
+        else 1
+    )
+    if workers <= 1:
+        return [fn(p) for p in pages]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, pages))
 
 
 # --------------------------- CAPS heuristics ---------------------------
@@ -36,15 +115,18 @@ def is_all_caps_line(s: str) -> bool:
 
     We ignore digits and punctuation. Whitespace is stripped at both ends.
     """
-    s = s.strip()
-    if not s:
-        return False
+    if s.isascii():
+        # For ASCII every letter is cased, so str.isupper() is exactly
+        # "at least one letter and no lowercase letter", evaluated in C.
+        return s.isupper()
 
-    letters = [ch for ch in s if ch.isalpha()]
-    if not letters:
-        return False
-
-    return all(ch.isupper() for ch in letters)
+    seen = False
+    for ch in s:
+        if ch.isalpha():
+            if not ch.isupper():
+                return False
+            seen = True
+    return seen
 
 
 def is_mostly_caps(s: str, threshold: float = 0.7) -> bool:
@@ -53,39 +135,125 @@ def is_mostly_caps(s: str, threshold: float = 0.7) -> bool:
     We count alphabetic characters only and consider the line "mostly caps"
     if the fraction of uppercase letters is >= `threshold`.
     """
-    s = s.strip()
-    if not s:
-        return False
+    if s.isascii():
+        # ASCII uppercase characters are all letters; count both in C.
+        letters = sum(map(str.isalpha, s))
+        upper = sum(map(str.isupper, s))
+    else:
+        letters = upper = 0
+        for ch in s:
+            if ch.isalpha():
+                letters += 1
+                if ch.isupper():
+                    upper += 1
 
-    letters = [ch for ch in s if ch.isalpha()]
     if not letters:
         return False
-    return sum(1 for ch in letters if ch.isupper()) / len(letters) >= threshold
+    return upper / letters >= threshold
 
 
 # --------------------------- Basic line helpers ---------------------------
 
 
-def _line_text(line: Line) -> str:
-    """Join all span texts in a line and strip outer whitespace."""
-    return "".join(sp.text for sp in line.spans).strip()
+# Maps id(line) -> _line_text(line). Only valid while the lines it was built
+# from are alive, so it never outlives a single transform_pages() run.
+_LineTextCache = Dict[int, str]
 
 
-def _first_nonblank_line_text(page: PageText) -> str:
+class _LineFlags(IntFlag):
+    """Classification of a line's text shared by several transforms."""
+
+    BLANK = 1  # nothing left after stripping
+    BULLET_ONLY = 2  # a lone bullet glyph (see _BULLET_CHARS)
+    FOOTER_NOISE = 4  # page number or rule artifact (see _is_footer_noise)
+
+
+# Maps id(line) -> _LineFlags bits, alongside a _LineTextCache and under the
+# same lifetime rule.
+_LineFlagCache = Dict[int, int]
+
+# Plain ints for the bit tests in loops; IntFlag operators run Python code.
+_BLANK = int(_LineFlags.BLANK)
+_BULLET_ONLY = int(_LineFlags.BULLET_ONLY)
+_FOOTER_NOISE = int(_LineFlags.FOOTER_NOISE)
+
+
+def _line_text(line: Line, cache: Optional[_LineTextCache] = None) -> str:
+    """Join all span texts in a line and strip outer whitespace.
+
+    With a *cache*, a line's text is built at most once and interned, so
+    repeated lines (running headers) share one string object.
+    """
+    if cache is None:
+        return "".join(sp.text for sp in line.spans).strip()
+    t = cache.get(id(line))
+    if t is None:
+        t = cache[id(line)] = sys.intern("".join(sp.text for sp in line.spans).strip())
+    return t
+
+
+def _build_line_text_cache(pages: List[PageText]) -> _LineTextCache:
+    """Compute `_line_text` for every line of *pages* in one traversal."""
+    intern = sys.intern
+    return {
+        id(ln): intern("".join(sp.text for sp in ln.spans).strip())
+        for p in pages
+        for blk in p.blocks
+        for ln in blk.lines
+    }
+
+
+def _line_flags(
+    line: Line,
+    texts: Optional[_LineTextCache] = None,
+    flags: Optional[_LineFlagCache] = None,
+) -> int:
+    """Return the `_LineFlags` bits of a line.
+
+    With a *flags* cache each line is classified at most once, however many
+    transforms ask.
+    """
+    if flags is not None:
+        f = flags.get(id(line))
+        if f is not None:
+            return f
+
+    # The classes are exclusive, and the cheap character tests settle most
+    # lines before any regex runs.
+    text = _line_text(line, texts)
+    if not text:
+        f = _BLANK
+    elif len(text) == 1 and text in _BULLET_CHARS:
+        f = _BULLET_ONLY
+    elif text[0] in _FOOTER_NOISE_STARTERS or text[0].isdecimal():
+        f = _FOOTER_NOISE if _is_footer_noise(text) else 0
+    else:
+        f = 0
+
+    if flags is not None:
+        flags[id(line)] = f
+    return f
+
+
+def _first_nonblank_line_text(
+    page: PageText, cache: Optional[_LineTextCache] = None
+) -> str:
     """Return the text of the first non empty line on a page."""
     for blk in page.blocks:
         for ln in blk.lines:
-            t = _line_text(ln)
+            t = _line_text(ln, cache)
             if t:
                 return t
     return ""
 
 
-def _last_nonblank_line_text(page: PageText) -> str:
+def _last_nonblank_line_text(
+    page: PageText, cache: Optional[_LineTextCache] = None
+) -> str:
     """Return the text of the last non empty line on a page."""
     for blk in reversed(page.blocks):
         for ln in reversed(blk.lines):
-            t = _line_text(ln)
+            t = _line_text(ln, cache)
             if t:
                 return t
     return ""
@@ -102,35 +270,24 @@ def _normalized_text(s: str) -> str:
     """Normalize text for header/footer comparison.
 
     This strips surrounding whitespace, collapses internal whitespace,
-    and lowercases the result.
+    and lowercases the result. str.split() splits on exactly the characters
+    that regex whitespace matches, without a regex call.
     """
-    s = s.strip()
-    if not s:
-        return ""
-    return re.sub(r"\s+", " ", s).lower()
+    return " ".join(s.split()).lower()
 
 
-def _similarity(a: str, b: str) -> float:
-    """Return a crude similarity score between 0 and 1 for two strings.
-
-    We compute a token-based Jaccard similarity over words, with a small
-    smoothing factor to avoid zero-division.
-    """
-    na = _normalized_text(a)
-    nb = _normalized_text(b)
-    if not na or not nb:
-        return 0.0
-    sa = set(na.split())
-    sb = set(nb.split())
-    inter = len(sa & sb)
+def _word_jaccard(sa: set, sb: set) -> float:
+    """Jaccard similarity of two word sets (0.0 if both are empty)."""
     union = len(sa | sb)
     if union == 0:
         return 0.0
-    return inter / union
+    return len(sa & sb) / union
 
 
 def detect_repeating_edges(
     pages: List[PageText],
+    line_texts: Optional[_LineTextCache] = None,
+    min_pages: int = 2,
 ) -> Tuple[Optional[str], Optional[str]]:
     """Detect repeating header and footer strings across pages.
 
@@ -139,23 +296,23 @@ def detect_repeating_edges(
     normalized header/footer (above similarity threshold), we return the
     canonical string as the detected header/footer.
 
+    *line_texts* is an optional line-text cache shared with
+    `remove_header_footer`. Documents with fewer than *min_pages* pages
+    cannot have a repeating edge and are not scanned at all.
+
     Returns:
         (header, footer) where each is either a string or None if no stable
         pattern could be found.
     """
-    if not pages:
+    if len(pages) < max(min_pages, 1):
         return None, None
 
-    header_candidates: List[str] = []
-    footer_candidates: List[str] = []
-
-    for p in pages:
-        h = _first_nonblank_line_text(p)
-        f = _last_nonblank_line_text(p)
-        if h:
-            header_candidates.append(h)
-        if f:
-            footer_candidates.append(f)
+    header_candidates = [
+        h for p in pages if (h := _first_nonblank_line_text(p, line_texts))
+    ]
+    footer_candidates = [
+        f for p in pages if (f := _last_nonblank_line_text(p, line_texts))
+    ]
 
     if len(header_candidates) < 2 and len(footer_candidates) < 2:
         return None, None
@@ -164,21 +321,21 @@ def detect_repeating_edges(
         if not candidates:
             return None
 
-        normalized = [_normalized_text(c) for c in candidates if c.strip()]
-        if not normalized:
+        kept = [c for c in candidates if c.strip()]
+        if not kept:
             return None
+        normalized = list(map(_normalized_text, kept))
 
+        # Only the winner is needed: max() instead of sorting all counts.
         counts = Counter(normalized)
-        most_common, freq = counts.most_common(1)[0]
+        most_common, freq = max(counts.items(), key=itemgetter(1))
         frac = freq / len(normalized)
         if frac < threshold:
             return None
 
-        # Return one original candidate that matches the normalized winner.
-        for c in candidates:
-            if _normalized_text(c) == most_common:
-                return c
-        return None
+        # Return the first original candidate that matches the normalized
+        # winner, without normalizing the candidates again.
+        return kept[normalized.index(most_common)]
 
     header = _majority(header_candidates, _HEADER_SIMILARITY_THRESHOLD)
     footer = _majority(footer_candidates, _FOOTER_SIMILARITY_THRESHOLD)
@@ -187,9 +344,9 @@ def detect_repeating_edges(
 
 # We also apply a couple of pattern-based cleanups for typical page numbers.
 
-_FOOTER_DASH_PATTERN = re.compile(r"^-+\s*\d+\s*-+$")
-_FOOTER_PAGENUM_PATTERN = re.compile(r"^\d+$")
-_FOOTER_PAGE_LABEL_PATTERN = re.compile(r"^page\s+\d+$", re.IGNORECASE)
+# "- 3 -" style rules, bare page numbers and "Page N", as one alternation that
+# is applied with fullmatch.
+_FOOTER_NOISE_PATTERN = re.compile(r"(?:-+\s*\d+\s*-+|\d+|page\s+\d+)", re.IGNORECASE)
 
 
 def _is_footer_noise(text: str) -> bool:
@@ -202,59 +359,112 @@ def _is_footer_noise(text: str) -> bool:
         "---- 3 ----"
     """
     s = text.strip()
-    if not s:
-        return False
-    if _FOOTER_DASH_PATTERN.match(s):
-        return True
-    if _FOOTER_PAGENUM_PATTERN.match(s):
-        return True
-    if _FOOTER_PAGE_LABEL_PATTERN.match(s):
-        return True
-    return False
+    return bool(s) and _FOOTER_NOISE_PATTERN.fullmatch(s) is not None
+
+
+# Non-digit characters a _FOOTER_NOISE_PATTERN match can start with.
+_FOOTER_NOISE_STARTERS = frozenset("-pP")
+
+
+# Drops header, footer and footer-noise lines from one block's lines.
+_EdgeLineFilter = Callable[
+    [List[Line], Optional[_LineTextCache], Optional[_LineFlagCache]], List[Line]
+]
+
+
+def _edge_line_filter(header: Optional[str], footer: Optional[str]) -> _EdgeLineFilter:
+    """Build the per-block line filter for one detected (header, footer) pair.
+
+    Everything derived from the two strings is computed once here, rather
+    than per line, and bound into the returned function.
+    """
+    check_header = bool(header)
+    check_footer = bool(footer)
+    check_edges = check_header or check_footer
+    # Cached line texts are interned, so a verbatim repeat of the detected
+    # header/footer is caught by identity before any normalization.
+    header_ref = sys.intern(header) if check_header else None
+    footer_ref = sys.intern(footer) if check_footer else None
+    header_norm = _normalized_text(header) if check_header else ""
+    footer_norm = _normalized_text(footer) if check_footer else ""
+    # Word sets for the Jaccard check, built once rather than per line.
+    header_words = set(header_norm.split())
+    footer_words = set(footer_norm.split())
+
+    def _filter(
+        lines: List[Line],
+        line_texts: Optional[_LineTextCache] = None,
+        line_flags: Optional[_LineFlagCache] = None,
+    ) -> List[Line]:
+        kept: List[Line] = []
+        for ln in lines:
+            text = _line_text(ln, line_texts)
+
+            # Without a header/footer only the noise check applies, so the
+            # line need not be normalized at all.
+            if check_edges:
+                if text is header_ref or text is footer_ref:
+                    continue
+                norm = _normalized_text(text)
+                if norm:
+                    # Exact repeats (the usual case) need no word sets.
+                    if norm == header_norm or norm == footer_norm:
+                        continue
+                    words = set(norm.split())
+                    # Strip header if it is very close.
+                    if check_header and _word_jaccard(words, header_words) >= 0.95:
+                        continue
+                    # Strip footer if it is very close.
+                    if check_footer and _word_jaccard(words, footer_words) >= 0.95:
+                        continue
+
+            # Strip footer noise.
+            if _line_flags(ln, line_texts, line_flags) & _FOOTER_NOISE:
+                continue
+
+            kept.append(ln)
+
+        return kept
+
+    return _filter
 
 
 def remove_header_footer(
-    pages: List[PageText], header: Optional[str], footer: Optional[str]
+    pages: List[PageText],
+    header: Optional[str],
+    footer: Optional[str],
+    line_texts: Optional[_LineTextCache] = None,
+    line_flags: Optional[_LineFlagCache] = None,
 ) -> List[PageText]:
-    """Return copies of pages with matching header or footer lines removed.
+    """Return pages with matching header or footer lines removed.
 
     We compare the joined text of each line to the detected strings and also
     apply some light pattern based cleanup for common footer artifacts like
-    "- - 1" or "---- 7 ----".
+    "- - 1" or "---- 7 ----". *line_texts* and *line_flags* are optional
+    caches shared with the other transforms.
+    Pages and blocks that lose no lines are returned as-is, not copied.
     """
     if not pages:
         return pages
 
-    header_norm = _normalized_text(header) if header else ""
-    footer_norm = _normalized_text(footer) if footer else ""
-
+    filter_lines = _edge_line_filter(header, footer)
     out_pages: List[PageText] = []
 
     for p in pages:
         new_blocks: List[Block] = []
+        page_modified = False
 
         for blk in p.blocks:
-            new_lines: List[Line] = []
-            for ln in blk.lines:
-                text = _line_text(ln)
-                norm = _normalized_text(text)
-
-                # Strip header if it matches (or is very close).
-                if header and norm and _similarity(norm, header_norm) >= 0.95:
-                    continue
-
-                # Strip footer if it matches (or is noise).
-                if footer and norm and _similarity(norm, footer_norm) >= 0.95:
-                    continue
-                if _is_footer_noise(text):
-                    continue
+            new_lines = filter_lines(blk.lines, line_texts, line_flags)
+            if not new_lines:
+                page_modified = True  # block dropped
+            elif len(new_lines) == len(blk.lines):
+                new_blocks.append(blk)
+            else:
+                new_blocks.append(_with_lines(blk, new_lines))
+                page_modified = True
 
-                new_lines.append(ln)
-
-            if new_lines:
-                new_blocks.append(replace(blk, lines=new_lines))
-
-        out_pages.append(replace(p, blocks=new_blocks))
+        out_pages.append(_with_blocks(p, new_blocks) if page_modified else p)
 
     return out_pages
 
@@ -267,87 +477,146 @@ def strip_drop_caps_in_page(page: PageText) -> PageText:
 
     Heuristic: if the first span in the first non blank line of a block is a
     single alphabetic character, and its font size is much larger than the
-    median size of the rest of the line, we remove it.
+    median size of the rest of the line, we remove it. A page without drop
+    caps is returned unchanged.
     """
     new_blocks: List[Block] = []
+    page_modified = False
 
     for blk in page.blocks:
         lines = blk.lines
-        if not lines:
-            new_blocks.append(blk)
-            continue
-
-        modified = False
-        new_lines: List[Line] = []
+        new_lines: Optional[List[Line]] = None
 
-        for ln in lines:
-            spans = ln.spans
-            if not spans:
-                new_lines.append(ln)
-                continue
-
-            # Find first non empty span.
-            first_idx = None
-            for i, sp in enumerate(spans):
-                if sp.text.strip():
-                    first_idx = i
-                    break
+        for idx, ln in enumerate(lines):
+            new_ln = _try_strip_dropcap(ln)
+            if new_ln is not ln:
+                if new_lines is None:
+                    new_lines = list(lines)
+                new_lines[idx] = new_ln
 
-            if first_idx is None:
-                new_lines.append(ln)
-                continue
+        if new_lines is None:
+            new_blocks.append(blk)
+        else:
+            new_blocks.append(_with_lines(blk, new_lines))
+            page_modified = True
+
+    return _with_blocks(page, new_blocks) if page_modified else page
+
+
+def _try_strip_dropcap(ln: Line) -> Line:
+    """Return *ln* without its drop cap span, or *ln* itself if it has none."""
+    spans = ln.spans
+    # Find first non empty span.
+    for first_idx, first in enumerate(spans):
+        first_text = first.text.strip()
+        if first_text:
+            break
+    else:
+        return ln
+
+    rest = spans[first_idx + 1 :]
+
+    if not (
+        len(first_text) == 1
+        and first_text.isalpha()
+        and first.size > 0
+        and rest
+    ):
+        return ln
+
+    # Compute median size of rest-of-line. The median is at least the
+    # smallest size, so a first span that does not clear 1.5x the smallest
+    # one cannot clear 1.5x the median either.
+    sizes = [sp.size for sp in rest if sp.size > 0]
+    if not sizes or first.size < 1.5 * min(sizes):
+        return ln
+    if first.size < 1.5 * median(sizes):
+        return ln
+
+    # Drop-cap detected: remove this span.
+    return _with_spans(ln, spans[:first_idx] + rest)
+
+
+def strip_drop_caps(pages: List[PageText], jobs: Optional[int] = 1) -> List[PageText]:
+    """Apply `strip_drop_caps_in_page` to all pages.
+
+    *jobs* > 1 (or None for one per CPU) lets long documents use worker
+    threads on free-threaded builds; see `_parallel_map`.
+    """
+    return _parallel_map(strip_drop_caps_in_page, pages, jobs)
 
-            first = spans[first_idx]
-            rest = spans[first_idx + 1 :]
-
-            if (
-                len(first.text.strip()) == 1
-                and first.text.strip().isalpha()
-                and first.size > 0
-                and rest
-            ):
-                # Compute median size of rest-of-line.
-                sizes = [sp.size for sp in rest if sp.size > 0]
-                if sizes:
-                    sizes_sorted = sorted(sizes)
-                    mid = len(sizes_sorted) // 2
-                    if len(sizes_sorted) % 2 == 1:
-                        median = sizes_sorted[mid]
-                    else:
-                        median = 0.5 * (
-                            sizes_sorted[mid - 1] + sizes_sorted[mid]
-                        )
-
-                    if first.size >= 1.5 * median:
-                        # Drop-cap detected: remove this span.
-                        new_spans = spans[:first_idx] + rest
-                        new_ln = replace(ln, spans=new_spans)
-                        new_lines.append(new_ln)
-                        modified = True
-                        continue
 
-            new_lines.append(ln)
+# --------------------------- Bullet line merging ---------------------------
 
-        if modified:
-            new_blocks.append(replace(blk, lines=new_lines))
-        else:
-            new_blocks.append(blk)
 
-    return replace(page, blocks=new_blocks)
+# A stripped line consisting of one of these is a bullet-only line.
+_BULLET_CHARS = frozenset("•◦·-—–")
 
 
-def strip_drop_caps(pages: List[PageText]) -> List[PageText]:
-    """Apply `strip_drop_caps_in_page` to all pages."""
-    return [strip_drop_caps_in_page(p) for p in pages]
+def _merge_bullet_line_list(
+    lines: List[Line],
+    line_texts: Optional[_LineTextCache] = None,
+    line_flags: Optional[_LineFlagCache] = None,
+) -> List[Line]:
+    """Merge bullet-only lines in *lines* with their following text lines.
 
+    Returns *lines* itself when nothing was merged.
+    """
+    modified = False
+    merged_lines: List[Line] = []
+    i = 0
+    n = len(lines)
+
+    while i < n:
+        ln = lines[i]
+
+        if (
+            _line_flags(ln, line_texts, line_flags) & _BULLET_ONLY
+            and i + 1 < n
+            and not _line_flags(lines[i + 1], line_texts, line_flags) & _BLANK
+        ):
+            # Bullet-only line followed by a non-empty line.
+            bullet_span = ln.spans[0] if ln.spans else None
+            nxt = lines[i + 1]
+            if bullet_span is None:
+                # Fallback: just keep the next line as-is.
+                merged_lines.append(nxt)
+                modified = True
+                i += 2
+                continue
 
-# --------------------------- Bullet line merging ---------------------------
+            # Combined spans: bullet spans followed by the next line's spans,
+            # built as one new list and patched in place.
+            combined_spans = ln.spans + nxt.spans
+            if nxt.spans:
+                # Prepend bullet span text + a space to the next line's
+                # first span. Preserve its style; only modify text.
+                k = len(ln.spans)
+                first_span = combined_spans[k]
+                bullet_text = bullet_span.text.strip() or "•"
+                new_text = f"{bullet_text} {first_span.text.lstrip()}"
+                combined_spans[k] = _with_text(first_span, new_text)
+            else:
+                # No spans? Use the bullet span as the next line's span.
+                combined_spans.append(bullet_span)
+
+            merged_ln = _with_spans(nxt, combined_spans)
+            merged_lines.append(merged_ln)
+            modified = True
+            i += 2
+            continue
 
+        merged_lines.append(ln)
+        i += 1
 
-_BULLET_ONLY_PATTERN = re.compile(r"^[•◦◦·\-—–]\s*$")
+    return merged_lines if modified else lines
 
 
-def _merge_bullet_lines_in_page(page: PageText) -> PageText:
+def _merge_bullet_lines_in_page(
+    page: PageText,
+    line_texts: Optional[_LineTextCache] = None,
+    line_flags: Optional[_LineFlagCache] = None,
+) -> PageText:
     """Merge bullet only lines with their following text lines.
 
     Many PDFs encode bullets as one line containing only "•" and the actual
@@ -358,68 +627,81 @@ def _merge_bullet_lines_in_page(page: PageText) -> PageText:
         This is the first bullet item.
 
     We instead want a single logical line that starts with "• " followed
-    by the item text.
+    by the item text. Blocks and pages without such lines are returned
+    unchanged. *line_texts* and *line_flags* are optional shared caches.
     """
     new_blocks: List[Block] = []
+    page_modified = False
 
     for blk in page.blocks:
         lines = blk.lines
-        if not lines:
-            new_blocks.append(blk)
+        if len(lines) < 2:
+            new_blocks.append(blk)  # nothing to merge with
             continue
+        merged_lines = _merge_bullet_line_list(lines, line_texts, line_flags)
+        if merged_lines is lines:
+            new_blocks.append(blk)
+        else:
+            new_blocks.append(_with_lines(blk, merged_lines))
+            page_modified = True
 
-        merged_lines: List[Line] = []
-        i = 0
-        n = len(lines)
-
-        while i < n:
-            ln = lines[i]
-            text = _line_text(ln)
-
-            if (
-                _BULLET_ONLY_PATTERN.match(text)
-                and i + 1 < n
-                and _line_text(lines[i + 1])
-            ):
-                # Bullet-only line followed by a non-empty line.
-                bullet_span = ln.spans[0] if ln.spans else None
-                nxt = lines[i + 1]
-                if bullet_span is None:
-                    # Fallback: just keep the next line as-is.
-                    merged_lines.append(nxt)
-                    i += 2
-                    continue
+    return _with_blocks(page, new_blocks) if page_modified else page
 
-                # Prepend bullet span text + a space to the next line's first span.
-                nxt_spans = list(nxt.spans)
-                if nxt_spans:
-                    first_span = nxt_spans[0]
-                    # Preserve style of the next line; only modify text.
-                    bullet_text = bullet_span.text.strip() or "•"
-                    new_text = f"{bullet_text} {first_span.text.lstrip()}"
-                    nxt_spans[0] = replace(first_span, text=new_text)
-                else:
-                    # No spans? Use the bullet span as a single-span line.
-                    nxt_spans = [bullet_span]
-
-                # Combined spans: bullet spans followed by modified next line spans.
-                combined_spans = list(ln.spans) + nxt_spans
-                merged_ln = replace(nxt, spans=combined_spans)
-                merged_lines.append(merged_ln)
-                i += 2
-                continue
 
-            merged_lines.append(ln)
-            i += 1
+def merge_bullet_lines(
+    pages: List[PageText],
+    jobs: Optional[int] = 1,
+    line_texts: Optional[_LineTextCache] = None,
+    line_flags: Optional[_LineFlagCache] = None,
+) -> List[PageText]:
+    """Apply `_merge_bullet_lines_in_page` to all pages.
+
+    *jobs* works as for `strip_drop_caps`.
+    """
+    if line_texts is None and line_flags is None:
+        return _parallel_map(_merge_bullet_lines_in_page, pages, jobs)
+    fn = partial(_merge_bullet_lines_in_page, line_texts=line_texts, line_flags=line_flags)
+    return _parallel_map(fn, pages, jobs)
 
-        new_blocks.append(replace(blk, lines=merged_lines))
 
-    return replace(page, blocks=new_blocks)
+# ---------------------------- Fused line pass ----------------------------
 
 
-def merge_bullet_lines(pages: List[PageText]) -> List[PageText]:
-    """Apply `_merge_bullet_lines_in_page` to all pages."""
-    return [_merge_bullet_lines_in_page(p) for p in pages]
+def _clean_page(
+    page: PageText,
+    filter_lines: Optional[_EdgeLineFilter],
+    line_texts: Optional[_LineTextCache] = None,
+    line_flags: Optional[_LineFlagCache] = None,
+) -> PageText:
+    """`remove_header_footer` followed by `_merge_bullet_lines_in_page`, fused.
+
+    Each block's lines go through *filter_lines* (from `_edge_line_filter`;
+    skipped when None) and are then bullet-merged, so a block and its page
+    are each copied at most once instead of once per step.
+    """
+    new_blocks: List[Block] = []
+    page_modified = False
+
+    for blk in page.blocks:
+        lines = kept = blk.lines
+        if filter_lines is not None:
+            kept = filter_lines(lines, line_texts, line_flags)
+            if not kept:
+                page_modified = True  # block dropped
+                continue
+            if len(kept) == len(lines):
+                kept = lines
+
+        merged_lines = kept
+        if len(kept) > 1:
+            merged_lines = _merge_bullet_line_list(kept, line_texts, line_flags)
+        if merged_lines is lines:
+            new_blocks.append(blk)
+        else:
+            new_blocks.append(_with_lines(blk, merged_lines))
+            page_modified = True
+
+    return _with_blocks(page, new_blocks) if page_modified else page
 
 
 # ------------------------------ Body sizes ------------------------------
@@ -439,21 +721,9 @@ def estimate_body_size(pages: List[PageText]) -> List[float]:
             for blk in p.blocks
             for ln in blk.lines
             for sp in ln.spans
-            if sp.size > 0 and (sp.text or "").strip()
+            if sp.size > 0 and sp.text and not sp.text.isspace()
         ]
-
-        if not sizes:
-            body_sizes.append(11.0)
-            continue
-
-        sizes_sorted = sorted(sizes)
-        mid = len(sizes_sorted) // 2
-        if len(sizes_sorted) % 2 == 1:
-            median = sizes_sorted[mid]
-        else:
-            median = 0.5 * (sizes_sorted[mid - 1] + sizes_sorted[mid])
-
-        body_sizes.append(median)
+        body_sizes.append(median(sizes) if sizes else 11.0)
 
     return body_sizes
 
@@ -500,7 +770,9 @@ def _annotate_tables_on_page(page: PageText, debug: bool = False) -> PageText:
                     row = row + [''] * (max_cols - len(row))
                 normalized_grid.append(row)
             
-            # Attach table metadata as dynamic attributes
+            # Attach table metadata as dynamic attributes, on a copy: the
+            # block may still be the caller's own input object.
+            blk = _with_lines(blk, blk.lines)
             setattr(blk, "is_table", True)
             setattr(blk, "table_grid", normalized_grid)
             setattr(blk, "table_type", det.detection_type)
@@ -517,7 +789,7 @@ def _annotate_tables_on_page(page: PageText, debug: bool = False) -> PageText:
         
         new_blocks.append(blk)
     
-    return replace(page, blocks=new_blocks)
+    return _with_blocks(page, new_blocks)
 
 
 def annotate_tables(pages: List[PageText], debug: bool = False) -> List[PageText]:
@@ -563,19 +835,12 @@ def transform_pages(
         - footer: Detected repeating footer string (or None)
         - body_sizes: Per-page body font size baselines
     """
-    # 1. Strip decorative drop caps.
-    pages_t = strip_drop_caps(pages)
+    # 1-2. Strip drop caps; detect repeating header/footer (if enabled).
+    pages_t, header, footer, clean = _prepare_transform(pages, options)
 
-    # 2. Detect repeating header or footer and remove them (if enabled).
-    header: Optional[str] = None
-    footer: Optional[str] = None
-
-    if options.remove_headers_footers:
-        header, footer = detect_repeating_edges(pages_t)
-        pages_t = remove_header_footer(pages_t, header, footer)
-
-    # 3. Merge bullet only lines with following text lines for list detection.
-    pages_t = merge_bullet_lines(pages_t)
+    # 3. Remove the header/footer and merge bullet only lines with following
+    #    text lines for list detection, in one pass per page.
+    pages_t = _parallel_map(clean, pages_t, options.jobs)
 
     # 4. Detect simple text tables and annotate blocks.
     pages_t = annotate_tables(pages_t, debug=debug_tables)
@@ -590,6 +855,67 @@ def transform_pages(
     return pages_t, header, footer, body_sizes
 
 
+def iter_transform_pages(
+    pages: List[PageText],
+    options: Options,
+    debug_tables: bool = False,
+) -> Iterator[Tuple[PageText, float]]:
+    """Run `transform_pages` lazily, yielding ``(page, body_size)`` per page.
+
+    Drop caps are stripped and the header/footer detected for the whole
+    document when iteration starts, since detection needs every page. After
+    that each page is cleaned, annotated and measured only when requested,
+    so rendering can start before the last page is transformed.
+
+    This does not make the transform run in constant memory. Until the
+    generator is exhausted it keeps the drop-cap-stripped pages, which are
+    mostly the caller's own page objects, and with header/footer removal
+    on, the text of every line. Only the cleaned and annotated copies are
+    made one page at a time. The detected header/footer are not reported;
+    use `transform_pages` when they are needed.
+    """
+    pages_t, _header, _footer, clean = _prepare_transform(pages, options)
+
+    for page in pages_t:
+        page = _annotate_tables_on_page(clean(page), debug=debug_tables)
+        annotate_math_on_page(page)
+        yield page, estimate_body_size([page])[0]
+
+
+def _prepare_transform(
+    pages: List[PageText],
+    options: Options,
+) -> Tuple[List[PageText], Optional[str], Optional[str], Callable[[PageText], PageText]]:
+    """Document-wide steps 1-2 of `transform_pages`.
+
+    Strips drop caps and, if enabled, detects the repeating header/footer.
+    Returns the stripped pages, the header and footer, and the per-page
+    cleanup (header/footer removal plus bullet merging) still to apply.
+    """
+    pages_t = strip_drop_caps(pages, options.jobs)
+
+    header: Optional[str] = None
+    footer: Optional[str] = None
+
+    # Detection, removal and merging read and classify the same lines; join
+    # and classify each line only once. Merging alone visits each line once
+    # and needs no cache.
+    line_texts: Optional[_LineTextCache] = None
+    line_flags: Optional[_LineFlagCache] = None
+    filter_lines: Optional[_EdgeLineFilter] = None
+
+    if options.remove_headers_footers:
+        line_texts = _build_line_text_cache(pages_t)
+        line_flags = {}
+        header, footer = detect_repeating_edges(pages_t, line_texts)
+        filter_lines = _edge_line_filter(header, footer)
+
+    clean = partial(
+        _clean_page, filter_lines=filter_lines, line_texts=line_texts, line_flags=line_flags
+    )
+    return pages_t, header, footer, clean
+
+
 __all__ = [
     "is_all_caps_line",
     "is_mostly_caps",
@@ -601,4 +927,5 @@ __all__ = [
     "estimate_body_size",
     "annotate_tables",
     "transform_pages",
+    "iter_transform_pages",
 ]
\ No newline at end of file
@@ -12,7 +12,7 @@ import os
 import sys
 import re
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -195,11 +195,47 @@ def escape_markdown(text: str) -> str:
     return "".join(out_chars)
 
 
+# ---------------------------------------------------------------------------
+# WORKER POOLS
+# ---------------------------------------------------------------------------
+
+
+def gil_disabled() -> bool:
+    """Return True on a free-threaded build running with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def worker_count(tasks: int, jobs: Optional[int] = None, threads: bool = False) -> int:
+    """Return how many workers to spread *tasks* independent tasks over.
+
+    *jobs* follows `Options.jobs`: a positive value caps the pool, None means
+    one worker per CPU. There are never more workers than tasks, and 1 means
+    run inline. Pure-Python work on *threads* only runs in parallel when the
+    GIL is disabled, so every other build gets 1.
+    """
+    if threads and not gil_disabled():
+        return 1
+    cpus = jobs if jobs and jobs > 0 else (os.cpu_count() or 1)
+    return max(1, min(cpus, tasks))
+
+
 # ---------------------------------------------------------------------------
 # MISC
 # ---------------------------------------------------------------------------
 
 
+def median(xs: List[float]) -> float:
+    """Median of a non-empty list of floats.
+
+    Used per line and per page, so this skips the type checks and argument
+    validation of `statistics.median`; the lists are short.
+    """
+    n = len(xs)
+    s = sorted(xs)
+    return s[n // 2] if n & 1 else 0.5 * (s[n // 2 - 1] + s[n // 2])
+
+
 def truncate(text: str, max_len: int = 120) -> str:
     """Truncate a string for logging/debug, preserving the end.
 
@@ -223,7 +259,10 @@ __all__ = [
     "linkify_urls",
     "escape_markdown",
     "truncate",
+    "median",
     "is_windows",
     "clear_console",
     "print_error",
+    "gil_disabled",
+    "worker_count",
 ]
@@ -0,0 +1,33 @@
+"""Tests for native PyMuPDF extraction."""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from pdfmd.extract import extract_pages
+from pdfmd.models import Options
+
+
+def _ligature_pdf(path, pages: int) -> None:
+    doc = fitz.open()
+    font = fitz.Font("helv")  # has the U+FB01 / U+FB03 ligature glyphs
+    for _ in range(pages):
+        page = doc.new_page()
+        writer = fitz.TextWriter(page.rect)
+        writer.append((72, 72), "ﬁnal oﬃce", font=font, fontsize=12)
+        writer.write_text(page)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.mark.parametrize("pages, jobs", [(1, 1), (11, 2)])  # in-process, worker pool
+def test_native_extraction_expands_ligatures(tmp_path, pages, jobs):
+    pdf = tmp_path / "ligatures.pdf"
+    _ligature_pdf(pdf, pages)
+
+    out = extract_pages(str(pdf), Options(jobs=jobs))
+
+    assert len(out) == pages
+    for page in out:
+        text = "".join(sp.text for blk in page.blocks for ln in blk.lines for sp in ln.spans)
+        assert text.strip() == "final office"
@@ -0,0 +1,69 @@
+"""Tests for OCRmyPDF page-range splitting and merging.
+
+OCRmyPDF itself is replaced by a copy, so these run without it installed.
+"""
+
+import shutil
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+import pdfmd.extract as extract
+from pdfmd.models import Options
+
+
+def _numbered_pdf(path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"page {i}", fontsize=12)
+    doc.save(str(path))
+    doc.close()
+
+
+def _page_count(path) -> int:
+    with fitz.open(path) as doc:
+        return doc.page_count
+
+
+@pytest.fixture
+def fake_ocrmypdf(monkeypatch):
+    runs = []
+
+    def _run(ocrmypdf_bin, src, dst, jobs=None):
+        runs.append({"pages": _page_count(src), "jobs": jobs})
+        shutil.copyfile(src, dst)
+
+    monkeypatch.setattr(extract, "_which", lambda cmd: "/usr/bin/" + cmd)
+    monkeypatch.setattr(extract, "_run_ocrmypdf", _run)
+    return runs
+
+
+def _texts(pages):
+    return [
+        "".join(sp.text for blk in p.blocks for ln in blk.lines for sp in ln.spans).strip()
+        for p in pages
+    ]
+
+
+def test_ranges_are_merged_in_page_order(tmp_path, fake_ocrmypdf, monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 6)
+    pdf = tmp_path / "scan.pdf"
+    _numbered_pdf(pdf, 45)
+
+    pages = extract._extract_ocrmypdf_then_native(str(pdf), Options(jobs=3), None)
+
+    assert _texts(pages) == [f"page {i}" for i in range(45)]
+    assert sorted(run["pages"] for run in fake_ocrmypdf) == [5, 20, 20]
+    # Three concurrent runs share six CPUs.
+    assert [run["jobs"] for run in fake_ocrmypdf] == [2, 2, 2]
+
+
+def test_preview_only_ocrs_first_three_pages(tmp_path, fake_ocrmypdf):
+    pdf = tmp_path / "scan.pdf"
+    _numbered_pdf(pdf, 45)
+
+    pages = extract._extract_ocrmypdf_then_native(str(pdf), Options(preview_only=True), None)
+
+    assert _texts(pages) == ["page 0", "page 1", "page 2"]
+    assert [run["pages"] for run in fake_ocrmypdf] == [3]
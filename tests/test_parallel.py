@@ -0,0 +1,97 @@
+"""Tests for worker-pool sizing and the threaded transform/render paths.
+
+The threaded paths only switch on when the GIL is disabled, so the tests
+force that by patching `sys._is_gil_enabled` and compare against a normal
+sequential run.
+"""
+
+import sys
+
+import pytest
+
+import pdfmd.render as render_mod
+import pdfmd.transform as transform_mod
+from pdfmd.models import Block, Line, Options, PageText, Span
+from pdfmd.render import render_document
+from pdfmd.transform import transform_pages
+from pdfmd.utils import gil_disabled, worker_count
+
+
+def _make_pages(n: int):
+    pages = []
+    for i in range(n):
+        blocks = [
+            Block(lines=[Line(spans=[Span(text="Quarterly Report", size=9.0)])]),
+            Block(
+                lines=[
+                    Line(spans=[Span(text="W", size=30.0), Span(text="hen it began", size=11.0)]),
+                    Line(spans=[Span(text=f"the text of page {i} went on", size=11.0)]),
+                ]
+            ),
+            Block(
+                lines=[
+                    Line(spans=[Span(text="•", size=11.0)]),
+                    Line(spans=[Span(text="a bullet item", size=11.0)]),
+                ]
+            ),
+            Block(lines=[Line(spans=[Span(text=f"SECTION {i}", size=16.0, bold=True)])]),
+            Block(lines=[Line(spans=[Span(text=f"Page {i + 1}", size=9.0)])]),
+        ]
+        pages.append(PageText(blocks=blocks))
+    return pages
+
+
+class _CountingExecutor(transform_mod.ThreadPoolExecutor):
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        type(self).created += 1
+        super().__init__(*args, **kwargs)
+
+
+@pytest.fixture
+def no_gil(monkeypatch):
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    _CountingExecutor.created = 0
+    monkeypatch.setattr(transform_mod, "ThreadPoolExecutor", _CountingExecutor)
+    monkeypatch.setattr(render_mod, "ThreadPoolExecutor", _CountingExecutor)
+
+
+def test_worker_count_caps():
+    assert worker_count(10, jobs=3) == 3
+    assert worker_count(2, jobs=8) == 2
+    assert worker_count(0, jobs=4) == 1
+    assert worker_count(5, jobs=-1) >= 1
+
+
+def test_worker_count_threads_need_free_threading(monkeypatch):
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    assert not gil_disabled()
+    assert worker_count(100, jobs=4, threads=True) == 1
+
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    assert gil_disabled()
+    assert worker_count(100, jobs=4, threads=True) == 4
+
+
+def test_threaded_transform_matches_sequential(no_gil, monkeypatch):
+    options = Options(jobs=4)
+    threaded = transform_pages(_make_pages(40), options)
+    assert _CountingExecutor.created > 0
+
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    sequential = transform_pages(_make_pages(40), options)
+    assert threaded == sequential
+
+
+def test_threaded_render_matches_sequential(no_gil, monkeypatch):
+    options = Options(jobs=4, insert_page_breaks=True)
+    pages, _, _, body_sizes = transform_pages(_make_pages(20), Options(jobs=1))
+    threaded = render_document(pages, options, body_sizes)
+    assert _CountingExecutor.created > 0
+
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    sequential = render_document(pages, options, body_sizes)
+    assert threaded == sequential
+    assert "# SECTION 3" in threaded
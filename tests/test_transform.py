@@ -0,0 +1,79 @@
+"""Tests for the transform stage."""
+
+import pytest
+
+from pdfmd.models import Block, Line, Options, PageText, Span
+from pdfmd.render import render_document
+from pdfmd.transform import iter_transform_pages, transform_pages
+
+
+def _table_block() -> Block:
+    rows = ["Name   Age   City", "Alice   30   Paris", "Bob   25   Rome", "Carol   41   Oslo"]
+    return Block(lines=[Line(spans=[Span(text=row, size=11.0)]) for row in rows])
+
+
+def _make_pages(n: int):
+    pages = []
+    for i in range(n):
+        # Odd pages use a larger body size, so the 13pt note is only a heading
+        # on even pages; rendering with the wrong body sizes changes that.
+        body = 14.0 if i % 2 else 11.0
+        blocks = [
+            Block(lines=[Line(spans=[Span(text="Annual Report 2024", size=9.0)])]),
+            Block(
+                lines=[
+                    Line(spans=[Span(text="T", size=40.0), Span(text="he year began", size=body)]),
+                    Line(spans=[Span(text="•", size=body)]),
+                    Line(spans=[Span(text=f"item on page {i}", size=body)]),
+                    Line(spans=[Span(text="and the text goes on", size=body)]),
+                ]
+            ),
+            Block(lines=[Line(spans=[Span(text=f"Chapter {i}", size=24.0, bold=True)])]),
+            Block(lines=[Line(spans=[Span(text=f"Note {i}", size=13.0)])]),
+            _table_block(),
+            Block(lines=[Line(spans=[Span(text="Confidential", size=9.0)])]),
+        ]
+        pages.append(PageText(blocks=blocks))
+    return pages
+
+
+@pytest.mark.parametrize("remove_headers_footers", [True, False])
+def test_iter_transform_pages_matches_transform_pages(remove_headers_footers):
+    options = Options(remove_headers_footers=remove_headers_footers)
+
+    pages, header, footer, body_sizes = transform_pages(_make_pages(5), options)
+    pairs = list(iter_transform_pages(_make_pages(5), options))
+
+    assert (header is not None) == remove_headers_footers
+    assert [page for page, _ in pairs] == pages
+    assert [size for _, size in pairs] == body_sizes
+
+
+def test_iter_transform_pages_api_example_renders_the_same(tmp_path):
+    # The generator + body_sizes pattern from doc/API.md, section 5.3.
+    opts = Options(insert_page_breaks=True)
+    body_sizes = []
+
+    def transformed():
+        for page, body_size in iter_transform_pages(_make_pages(5), opts):
+            body_sizes.append(body_size)
+            yield page
+
+    out = tmp_path / "output.md"
+    with open(out, "w", encoding="utf-8") as f:
+        render_document(transformed(), options=opts, body_sizes=body_sizes, out_fp=f)
+
+    pages, _, _, sizes = transform_pages(_make_pages(5), opts)
+    expected = render_document(pages, opts, sizes)
+    assert out.read_text(encoding="utf-8") == expected
+    assert "## Note 0" in expected and "## Note 1" not in expected
+
+
+def test_table_annotation_leaves_input_blocks_alone():
+    block = _table_block()
+
+    out, _, _, _ = transform_pages([PageText(blocks=[block])], Options())
+
+    assert getattr(out[0].blocks[0], "is_table", False)
+    assert out[0].blocks[0] is not block
+    assert not hasattr(block, "is_table")